@@ -448,6 +448,8 @@ def hessian(
                 align_with_model(p, model)
             )
 
+        # Reverse-over-reverse: torch.func.hessian (forward-over-reverse) would
+        # iterate the data loader inside vmap, which fails on its random seed
         hessian_mat = torch.func.jacrev(torch.func.jacrev(flat_input_empirical_loss))(
             flat_params
         )
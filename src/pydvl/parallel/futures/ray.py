@@ -2,7 +2,6 @@ import logging
 import queue
 import sys
 import threading
-import time
 import types
 from concurrent.futures import Executor, Future
 from typing import Any, Callable, Optional, TypeVar, Union
@@ -28,6 +27,10 @@ T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+# Maximal time in seconds that the work item manager thread sleeps without being
+# notified, after which it checks whether the executor has been collected.
+_WAKEUP_TIMEOUT = 1.0
+
 
 class RayExecutor(Executor):
     """Asynchronous executor using Ray that implements the concurrent.futures API.
@@ -93,6 +96,8 @@ class RayExecutor(Executor):
         self._pending_queue: "queue.SimpleQueue[Optional[_WorkItem]]" = (
             queue.SimpleQueue()
         )
+        # Set whenever a work item is queued, to wake up the manager thread
+        self._wakeup = threading.Event()
 
         # Work Item Manager Thread
         self._work_item_manager_thread: Optional[_WorkItemManagerThread] = None
@@ -186,6 +191,7 @@ class RayExecutor(Executor):
                 self._work_queue.put_nowait(work_item)
             except queue.Full:
                 self._pending_queue.put_nowait(work_item)
+        self._wakeup.set()
 
     def _start_work_item_manager_thread(self) -> None:
         if self._work_item_manager_thread is None:
@@ -262,14 +268,18 @@ class _WorkItemManagerThread(threading.Thread):
         self.pending_queue: "queue.SimpleQueue[Optional[_WorkItem]]" = (
             executor._pending_queue
         )
+        self.wakeup: threading.Event = executor._wakeup
         self.submitted_futures: "WeakSet[Future]" = WeakSet()
         super().__init__()
 
     def run(self) -> None:
         logger.debug("starting work item manager thread main loop")
         while True:
-            # This is used to avoid using too much CPU
-            time.sleep(0.01)
+            # Sleep until a work item is queued instead of polling the queues.
+            # Emptiness is checked before waiting, so no notification is lost.
+            if self.work_queue.empty() and self.pending_queue.empty():
+                self.wakeup.wait(timeout=_WAKEUP_TIMEOUT)
+            self.wakeup.clear()
             try:
                 self.add_pending_item_to_work_queue()
                 self.submit_work_item()
@@ -288,8 +298,6 @@ class _WorkItemManagerThread(threading.Thread):
         # Fills work_queue with _WorkItems from pending_queue.
         # This function never blocks.
         while True:
-            # This is used to avoid using too much CPU
-            time.sleep(0.01)
             with self.queue_lock:
                 logger.debug("work item manager thread acquired queue lock")
                 # If the work queue is not full,
@@ -12,6 +12,8 @@ from typing import (
     Optional,
     Sequence,
     TypeVar,
+    Union,
+    overload,
 )
 
 import numpy as np
@@ -292,15 +294,39 @@ def random_matrix_with_condition_number(
     return P
 
 
+@overload
 def running_moments(
     previous_avg: float,
     previous_variance: float,
     count: int,
     new_value: float,
     unbiased: bool = True,
-) -> tuple[float, float]:
+) -> tuple[float, float]: ...
+
+
+@overload
+def running_moments(
+    previous_avg: NDArray[np.float64],
+    previous_variance: NDArray[np.float64],
+    count: NDArray[np.int_],
+    new_value: NDArray[np.float64],
+    unbiased: bool = True,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]: ...
+
+
+def running_moments(
+    previous_avg: Union[float, NDArray[np.float64]],
+    previous_variance: Union[float, NDArray[np.float64]],
+    count: Union[int, NDArray[np.int_]],
+    new_value: Union[float, NDArray[np.float64]],
+    unbiased: bool = True,
+) -> tuple[Union[float, NDArray[np.float64]], Union[float, NDArray[np.float64]]]:
     """Calculates running average and variance of a series of numbers.
 
+    All arguments can also be arrays of the same shape, to update several
+    series at once elementwise. The unbiased estimator is only supported for
+    scalars.
+
     See [Welford's algorithm in
     wikipedia](https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Welford's_online_algorithm)
 
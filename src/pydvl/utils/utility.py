@@ -13,6 +13,9 @@ It is automatically cached across machines when the
 for learning the scoring function to avoid repeated re-training
 of the model to compute the score.
 
+[SubsetCache][pydvl.utils.utility.SubsetCache] memoizes a utility locally, for
+methods which repeatedly sample the same subsets.
+
 This module also contains derived `Utility` classes for toy games that are used
 for testing and for demonstration purposes.
 
@@ -24,8 +27,10 @@ for testing and for demonstration purposes.
 
 """
 
+import hashlib
 import logging
 import warnings
+from collections import OrderedDict
 from typing import Dict, FrozenSet, Iterable, Optional, Tuple, Union, cast
 
 import numpy as np
@@ -38,7 +43,7 @@ from pydvl.utils.caching import CacheBackend, CachedFuncConfig, CacheStats
 from pydvl.utils.score import Scorer
 from pydvl.utils.types import SupervisedModel
 
-__all__ = ["Utility", "DataUtilityLearning"]
+__all__ = ["Utility", "DataUtilityLearning", "SubsetCache"]
 
 logger = logging.getLogger(__name__)
 
@@ -356,3 +361,111 @@ class DataUtilityLearning:
     def data(self) -> Dataset:
         """Returns the wrapped utility's [Dataset][pydvl.utils.dataset.Dataset]."""
         return self.utility.data
+
+
+class SubsetCache:
+    """Bounded, local memoization of a [Utility][pydvl.utils.utility.Utility].
+
+    This object wraps a utility and delegates calls to it, remembering the
+    results of the last `maxsize` distinct subsets. Subsets are identified by
+    a fixed-size digest of their sorted indices, so that the order in which
+    indices are passed is irrelevant, and memory does not grow with the size of
+    the subsets.
+
+    As opposed to the [cache backends][pydvl.utils.caching], this cache lives
+    in the process which creates it and is meant to be short-lived, e.g. for
+    the duration of one job of a Monte Carlo method, where the same subsets
+    (typically very small or very large ones) are often sampled repeatedly.
+    It brings nothing when subsets rarely repeat, e.g. when sampling uniformly
+    from the powerset of a large dataset.
+
+    If the wrapped utility is configured to average repeated evaluations (see
+    [CachedFuncConfig][pydvl.utils.caching.config.CachedFuncConfig]), results
+    are not memoized and all calls are delegated.
+
+    Args:
+        u: The [Utility][pydvl.utils.utility.Utility] to wrap.
+        maxsize: Maximal number of subsets to remember. Least recently used
+            ones are discarded first.
+
+    ??? Example
+        ``` pycon
+        >>> from pydvl.utils import Utility, SubsetCache, Dataset
+        >>> from sklearn.linear_model import LogisticRegression
+        >>> from sklearn.datasets import load_iris
+        >>> dataset = Dataset.from_sklearn(load_iris(), random_state=16)
+        >>> cached_u = SubsetCache(Utility(LogisticRegression(random_state=16), dataset))
+        >>> cached_u([2, 1, 0]) == cached_u([0, 1, 2])
+        True
+        >>> cached_u.hits, cached_u.misses
+        (1, 1)
+        ```
+    """
+
+    def __init__(self, u: Utility, maxsize: int = 1 << 16) -> None:
+        self.utility = u
+        self.maxsize = maxsize
+        self._enabled = not getattr(
+            getattr(u, "cached_func_options", None),
+            "allow_repeated_evaluations",
+            False,
+        )
+        self._cache: OrderedDict[bytes, float] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, indices: Iterable[int]) -> float:
+        """
+        Args:
+            indices: a subset of valid indices for the
+                `x_train` attribute of [Dataset][pydvl.utils.dataset.Dataset].
+        """
+        if not self._enabled:
+            return self.utility(indices)
+        subset = np.sort(np.fromiter(indices, dtype=np.int_))
+        key = hashlib.blake2b(subset.tobytes(), digest_size=16).digest()
+        try:
+            value = self._cache[key]
+        except KeyError:
+            self._misses += 1
+            value = self.utility(subset)
+            self._cache[key] = value
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        else:
+            self._hits += 1
+            self._cache.move_to_end(key)
+        return value
+
+    def utilities(self, subsets: Iterable[Iterable[int]]) -> NDArray[np.float64]:
+        """Evaluates the utility on a batch of subsets, in order.
+
+        Args:
+            subsets: An iterable of subsets of valid indices for the `x_train`
+                attribute of [Dataset][pydvl.utils.dataset.Dataset].
+
+        Returns:
+            An array with the utility of each subset, in the same order.
+        """
+        return np.fromiter((self(s) for s in subsets), dtype=np.float64)
+
+    @property
+    def hits(self) -> int:
+        """Number of calls answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of calls delegated to the wrapped utility."""
+        return self._misses
+
+    def clear(self) -> None:
+        """Discards all remembered results."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def data(self) -> Dataset:
+        """Returns the wrapped utility's [Dataset][pydvl.utils.dataset.Dataset]."""
+        return self.utility.data
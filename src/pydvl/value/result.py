@@ -47,10 +47,11 @@ from __future__ import annotations
 import collections.abc
 import logging
 from dataclasses import dataclass
-from functools import total_ordering
+from functools import cached_property, total_ordering
 from numbers import Integral
 from typing import (
     Any,
+    Dict,
     Generic,
     Iterable,
     Iterator,
@@ -72,7 +73,7 @@ from pydvl.utils.numeric import running_moments
 from pydvl.utils.status import Status
 from pydvl.utils.types import IndexT, NameT, Seed
 
-__all__ = ["ValuationResult", "ValueItem"]
+__all__ = ["ValuationResult", "ValueItem", "sum_results"]
 
 logger = logging.getLogger(__name__)
 
@@ -251,13 +252,13 @@ class ValuationResult(
             self._names = np.array(data_names)
         else:
             self._names = data_names.copy()
-        if len(np.unique(self._names)) != len(self._names):
+        # Hash-based check, np.unique would sort all names
+        if len(set(self._names.tolist())) != len(self._names):
             raise ValueError("Data names must be unique")
 
         if indices is None:
             indices = np.arange(len(self._values), dtype=np.int_)
         self._indices = indices
-        self._positions = {idx: pos for pos, idx in enumerate(indices)}
 
         self._sort_positions: NDArray[np.int_] = np.arange(
             len(self._values), dtype=np.int_
@@ -337,6 +338,20 @@ class ValuationResult(
         """
         return self._names[self._sort_positions]
 
+    @cached_property
+    def _positions(self) -> Dict[Any, int]:
+        """Map from data indices to positions in the internal arrays.
+
+        Only data-based access needs it, so it is built on first use instead of
+        for every (possibly intermediate) result.
+        """
+        return {idx: pos for pos, idx in enumerate(self._indices)}
+
+    @cached_property
+    def _index_sorter(self) -> NDArray[np.int_]:
+        """Positions which sort the data indices, for vectorized lookups."""
+        return np.argsort(self._indices)
+
     @property
     def status(self) -> Status:
         return self._status
@@ -625,6 +640,44 @@ class ValuationResult(
         )
         return self
 
+    def update_many(
+        self, indices: NDArray[IndexT], new_values: NDArray[np.float64]
+    ) -> ValuationResult[IndexT, NameT]:
+        """Updates the result in place with one new value for each of several
+        data indices.
+
+        Equivalent to calling [update()][pydvl.value.result.ValuationResult.update]
+        for each pair of index and value, but the running means and variances
+        are updated in a single vectorized pass.
+
+        Args:
+            indices: Data indices of the values to update. Must be unique.
+            new_values: New values to add to the result, one per index.
+
+        Returns:
+            A reference to the same, modified result.
+
+        Raises:
+            IndexError: If an index is not found.
+        """
+        sorter = self._index_sorter
+        sorted_pos = np.searchsorted(self._indices, indices, sorter=sorter)
+        pos = sorter[np.minimum(sorted_pos, len(sorter) - 1)]
+        missing = self._indices[pos] != indices
+        if np.any(missing):
+            raise IndexError(
+                f"Index {np.asarray(indices)[missing][0]} not found in ValuationResult"
+            )
+        self._values[pos], self._variances[pos] = running_moments(
+            self._values[pos],
+            self._variances[pos],
+            self._counts[pos],
+            new_values,
+            unbiased=False,
+        )
+        self._counts[pos] += 1
+        return self
+
     def scale(self, factor: float, indices: Optional[NDArray[IndexT]] = None):
         """
         Scales the values and variances of the result by a coefficient.
@@ -806,3 +859,65 @@ class ValuationResult(
             variances=np.zeros(len(indices)),
             counts=np.zeros(len(indices), dtype=np.int_),
         )
+
+
+def sum_results(results: Sequence[ValuationResult]) -> ValuationResult:
+    """Adds a sequence of results, e.g. the partial results of parallel jobs.
+
+    Equivalent to `reduce(operator.add, results)`, see
+    [ValuationResult.__add__()][pydvl.value.result.ValuationResult.__add__],
+    but the means and variances of all results are pooled in a single pass over
+    the concatenated arrays, instead of merging the union of indices once per
+    term.
+
+    Args:
+        results: Results computed with the same algorithm, possibly with
+            overlapping indices.
+
+    Returns:
+        The combined result.
+
+    Raises:
+        ValueError: If the results were computed with different algorithms, or
+            the same index has different names in two of them.
+    """
+    results = [r for r in results if len(r.values) > 0]
+    if len(results) == 0:
+        return ValuationResult.empty()
+    if len(results) == 1:
+        return results[0]
+    for r in results[1:]:
+        results[0]._check_compatible(r)
+
+    indices, first_pos, inverse = np.unique(
+        np.concatenate([r.indices for r in results]),
+        return_index=True,
+        return_inverse=True,
+    )
+    names = np.concatenate([r.names for r in results])
+    if np.any(names != names[first_pos][inverse]):
+        raise ValueError("Mismatching names in ValuationResults")
+    values = np.concatenate([r.values for r in results])
+    variances = np.concatenate([r.variances for r in results])
+    counts = np.concatenate([r.counts for r in results])
+
+    n = np.bincount(inverse, weights=counts, minlength=len(indices))
+    # np.maximum(1, n) covers the case n = 0.
+    n_safe = np.maximum(1, n)
+    mean = np.bincount(inverse, weights=counts * values) / n_safe
+    second_moment = np.bincount(inverse, weights=counts * (variances + values**2))
+    variance = np.clip(second_moment / n_safe - mean**2, 0, None)
+
+    status = results[0].status
+    for r in results[1:]:
+        status &= r.status
+
+    return ValuationResult(
+        algorithm=results[0].algorithm,
+        status=status,
+        indices=indices,
+        values=mean,
+        variances=variance,
+        counts=n.astype(np.int_),
+        data_names=names[first_pos],
+    )
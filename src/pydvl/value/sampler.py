@@ -181,8 +181,14 @@ class PowersetSampler(abc.ABC, Iterable[SampleT], Generic[IndexT]):
             for idx in self._outer_indices:
                 yield idx
         elif self._index_iteration is PowersetSampler.IndexIteration.Random:
+            rng = self._index_rng()
             while True:
-                yield np.random.choice(self._outer_indices, size=1).item()
+                yield rng.choice(self._outer_indices, size=1).item()
+
+    def _index_rng(self) -> np.random.Generator:
+        """Generator for the random iteration over indices. Overridden by
+        seeded samplers, for reproducibility."""
+        return np.random.default_rng()
 
     @overload
     def __getitem__(self, key: slice) -> PowersetSampler[IndexT]: ...
@@ -239,6 +245,9 @@ class StochasticSamplerMixin:
         super().__init__(*args, **kwargs)
         self._rng = np.random.default_rng(seed)
 
+    def _index_rng(self) -> np.random.Generator:
+        return self._rng
+
 
 class DeterministicUniformSampler(PowersetSampler[IndexT]):
     def __init__(self, indices: NDArray[IndexT], *args, **kwargs):
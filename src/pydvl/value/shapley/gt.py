@@ -283,23 +283,23 @@ def group_testing_shapley(
     )
     uu, betas = map_reduce_job(seed=map_reduce_seed_sequence)
 
-    # Matrix of estimated differences. See Eqs. (3) and (4) in the paper.
-    C = np.zeros(shape=(n, n))
-    for i in range(n):
-        for j in range(i + 1, n):
-            C[i, j] = np.dot(uu, betas[:, i] - betas[:, j])
-    C *= const.Z / T
+    # Estimated differences for all pairs i < j. See Eqs. (3) and (4) in the
+    # paper. Because the differences are linear in the indicator variables,
+    # they follow from the utility-weighted counts of each index.
+    weighted_counts = uu @ betas
+    ii, jj = np.triu_indices(n, k=1)
+    C = (weighted_counts[ii] - weighted_counts[jj]) * const.Z / T
     total_utility = u(u.data.indices)
 
     ###########################################################################
     # Solution of the constraint problem with cvxpy
 
     v = cp.Variable(n)
-    constraints = [cp.sum(v) == total_utility]
-    for i in range(n):
-        for j in range(i + 1, n):
-            constraints.append(v[i] - v[j] <= epsilon + C[i, j])
-            constraints.append(v[j] - v[i] <= epsilon - C[i, j])
+    constraints = [
+        cp.sum(v) == total_utility,
+        v[ii] - v[jj] <= epsilon + C,
+        v[jj] - v[ii] <= epsilon - C,
+    ]
 
     problem = cp.Problem(cp.Minimize(0), constraints)
     solver = options.pop("solver", cp.SCS)
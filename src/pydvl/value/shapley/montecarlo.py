@@ -45,15 +45,15 @@ from __future__ import annotations
 
 import logging
 import math
-import operator
 from concurrent.futures import FIRST_COMPLETED, Future, wait
-from functools import reduce
 from typing import Optional, Sequence, Union
 
 import numpy as np
 from deprecate import deprecated
 from numpy.random import SeedSequence
 from numpy.typing import NDArray
+from scipy.special import gammaln
+from scipy.stats.qmc import Halton
 from tqdm.auto import tqdm
 
 from pydvl.parallel import (
@@ -63,11 +63,10 @@ from pydvl.parallel import (
     ParallelConfig,
     _maybe_init_parallel_backend,
 )
-from pydvl.utils.numeric import random_powerset
 from pydvl.utils.progress import repeat_indices
 from pydvl.utils.types import Seed, ensure_seed_sequence
 from pydvl.utils.utility import Utility
-from pydvl.value.result import ValuationResult
+from pydvl.value.result import ValuationResult, sum_results
 from pydvl.value.shapley.truncated import NoTruncation, TruncationPolicy
 from pydvl.value.stopping import StoppingCriterion
 
@@ -75,57 +74,100 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["permutation_montecarlo_shapley", "combinatorial_montecarlo_shapley"]
 
+# Upper bound on the number of entries of the blocks of subset masks sampled at
+# once by the combinatorial method.
+_MAX_MASK_BLOCK_ENTRIES = 2**20
+
+# Largest number of indices for quasi-random permutations. The scrambled
+# Halton sequence needs time and memory superlinear in its dimension.
+_MAX_HALTON_DIMENSION = 1000
+
+
+def _permutation_marginals(
+    u: Utility,
+    positions: NDArray[np.int_],
+    truncation: TruncationPolicy,
+) -> Optional[NDArray[np.float64]]:
+    """Computes the marginal utilities of all training samples along one
+    permutation.
+
+    The utilities of all prefixes of the permutation are computed first, and
+    the marginals are then obtained as their successive differences.
+
+    Args:
+        u: Utility object with model, data, and scoring function
+        positions: Permutation of the positions of the data indices in
+            `u.data.indices`.
+        truncation: A callable which decides whether to interrupt
+            processing a permutation and set all subsequent marginals to zero.
+
+    Returns:
+        The marginals, in the order of `u.data.indices`, or `None` if any of
+            them is NaN.
+    """
+    n = len(positions)
+    permutation = u.data.indices[positions]
+    truncation.reset()
+    scores = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        scores[i] = u(permutation[: i + 1])
+        if truncation(i, scores[i]):
+            # All subsequent marginals are zero
+            scores[i + 1 :] = scores[i]
+            break
+
+    values = np.empty(n, dtype=np.float64)
+    values[positions] = np.diff(scores, prepend=0.0)
+    nans = np.isnan(values).sum()
+    if nans > 0:
+        logger.warning(
+            f"{nans} NaN values in current permutation, ignoring. "
+            "Consider setting a default value for the Scorer"
+        )
+        return None
+    return values
+
 
 def _permutation_montecarlo_one_step(
     u: Utility,
     truncation: TruncationPolicy,
-    algorithm_name: str,
     seed: Optional[Union[Seed, SeedSequence]] = None,
-) -> ValuationResult:
+    antithetic: bool = False,
+    positions: Optional[NDArray[np.int_]] = None,
+) -> NDArray[np.float64]:
     """Helper function for
     [permutation_montecarlo_shapley()][pydvl.value.shapley.montecarlo.permutation_montecarlo_shapley].
 
     Computes marginal utilities of each training sample in a randomly sampled
-    permutation.
+    permutation, and optionally in its reverse.
+
+    Only the raw marginals are sent back, instead of a full
+    [ValuationResult][pydvl.value.result.ValuationResult] with indices, names,
+    variances and counts, which are the same for every permutation. The
+    driver accumulates them in place.
 
     Args:
         u: Utility object with model, data, and scoring function
         truncation: A callable which decides whether to interrupt
             processing a permutation and set all subsequent marginals to zero.
-        algorithm_name: For the results object. Used internally by different
-            variants of Shapley using this subroutine
         seed: Either an instance of a numpy random number generator or a seed
             for it.
+        antithetic: Whether to also compute the marginals along the reversed
+            permutation.
+        positions: If given, the permutation of the positions of the data
+            indices to use, instead of sampling one.
 
     Returns:
-        An object with the results
+        An array with one row of marginals per permutation, in the order of
+            `u.data.indices`. Permutations with NaN marginals are left out.
     """
-
-    result = ValuationResult.zeros(
-        algorithm=algorithm_name, indices=u.data.indices, data_names=u.data.data_names
+    if positions is None:
+        positions = np.random.default_rng(seed).permutation(len(u.data))
+    all_positions = [positions, positions[::-1]] if antithetic else [positions]
+    rows = [_permutation_marginals(u, p, truncation) for p in all_positions]
+    return np.array([r for r in rows if r is not None], dtype=np.float64).reshape(
+        -1, len(positions)
     )
-    prev_score = 0.0
-    permutation = np.random.default_rng(seed).permutation(u.data.indices)
-    permutation_done = False
-    truncation.reset()
-    for i, idx in enumerate(permutation):
-        if permutation_done:
-            score = prev_score
-        else:
-            score = u(permutation[: i + 1])
-        marginal = score - prev_score
-        result.update(idx, marginal)
-        prev_score = score
-        if not permutation_done and truncation(i, score):
-            permutation_done = True
-    nans = np.isnan(result.values).sum()
-    if nans > 0:
-        logger.warning(
-            f"{nans} NaN values in current permutation, ignoring. "
-            "Consider setting a default value for the Scorer"
-        )
-        result = ValuationResult.empty(algorithm=algorithm_name)
-    return result
 
 
 @deprecated(
@@ -144,6 +186,8 @@ def permutation_montecarlo_shapley(
     config: Optional[ParallelConfig] = None,
     progress: bool = False,
     seed: Optional[Seed] = None,
+    antithetic: bool = False,
+    quasi_random: bool = False,
 ) -> ValuationResult:
     r"""Computes an approximate Shapley value by sampling independent
     permutations of the index set, approximating the sum:
@@ -180,6 +224,24 @@ def permutation_montecarlo_shapley(
     until the [StoppingCriterion][pydvl.value.stopping.StoppingCriterion] returns
     `True`.
 
+    Parallelization happens across permutations: twice as many permutations as
+    there are workers are kept in the executor's queue, so that workers never
+    wait for the driver. The utilities of the prefixes of one permutation are
+    computed sequentially by the worker which processes it, since truncation
+    policies need them in order.
+
+    With `antithetic=True`, every sampled permutation is paired with its
+    reverse. The marginals along both permutations are negatively correlated,
+    which reduces the variance of the estimate for the same number of utility
+    evaluations. Each pair counts as two updates for the stopping criterion.
+
+    With `quasi_random=True`, permutations are obtained by sorting the points
+    of a scrambled [Halton sequence][scipy.stats.qmc.Halton] in $[0,1]^n$
+    instead of being sampled independently. The low discrepancy of the
+    sequence spreads the permutations more evenly over the space of all
+    permutations. Because the cost of initialising the sequence grows
+    superlinearly with $n$, this is only available for up to 1000 indices.
+
     Args:
         u: Utility object with model, data, and scoring function.
         done: function checking whether computation must stop.
@@ -196,10 +258,16 @@ def permutation_montecarlo_shapley(
             with cluster address, number of cpus, etc.
         progress: Whether to display a progress bar.
         seed: Either an instance of a numpy random number generator or a seed for it.
+        antithetic: Whether to pair each sampled permutation with its reverse.
+        quasi_random: Whether to generate permutations from a quasi-random
+            Halton sequence.
 
     Returns:
         Object with the data values.
 
+    Raises:
+        ValueError: If `quasi_random=True` and there are more than 1000 indices.
+
     !!! tip "Changed in version 0.9.0"
         Deprecated `config` argument and added a `parallel_backend`
         argument to allow users to pass the Parallel Backend instance
@@ -207,14 +275,26 @@ def permutation_montecarlo_shapley(
     """
     algorithm = "permutation_montecarlo_shapley"
 
+    if quasi_random and len(u.data.indices) > _MAX_HALTON_DIMENSION:
+        raise ValueError(
+            f"quasi_random is only supported for up to {_MAX_HALTON_DIMENSION} "
+            f"indices, got {len(u.data.indices)}"
+        )
+
     parallel_backend = _maybe_init_parallel_backend(parallel_backend, config)
     u = parallel_backend.put(u)
     max_workers = parallel_backend.effective_n_jobs(n_jobs)
     n_submitted_jobs = 2 * max_workers  # number of jobs in the executor's queue
 
     seed_sequence = ensure_seed_sequence(seed)
+    indices = u.data.indices
+    halton = (
+        Halton(d=len(indices), scramble=True, seed=np.random.default_rng(seed_sequence))
+        if quasi_random
+        else None
+    )
     result = ValuationResult.zeros(
-        algorithm=algorithm, indices=u.data.indices, data_names=u.data.data_names
+        algorithm=algorithm, indices=indices, data_names=u.data.data_names
     )
 
     pbar = tqdm(disable=not progress, total=100, unit="%")
@@ -223,13 +303,18 @@ def permutation_montecarlo_shapley(
         max_workers=max_workers, cancel_futures=CancellationPolicy.ALL
     ) as executor:
         pending: set[Future] = set()
+        # Submission order of pending futures. Results are processed in this
+        # order, so that runs with one worker are reproducible.
+        order: dict[Future, int] = {}
+        n_submitted = 0
         while True:
             pbar.n = 100 * done.completion()
             pbar.refresh()
 
             completed, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
-            for future in completed:
-                result += future.result()
+            for future in sorted(completed, key=lambda f: order.pop(f)):
+                for marginals in future.result():
+                    result.update_many(indices, marginals)
                 # we could check outside the loop, but that means more
                 # submissions if the stopping criterion is unstable
                 if done(result):
@@ -238,15 +323,21 @@ def permutation_montecarlo_shapley(
             # Ensure that we always have n_submitted_jobs in the queue or running
             n_remaining_slots = n_submitted_jobs - len(pending)
             seeds = seed_sequence.spawn(n_remaining_slots)
+            all_positions: list[Optional[NDArray[np.int_]]] = [None] * n_remaining_slots
+            if halton is not None:
+                all_positions[:] = np.argsort(halton.random(n_remaining_slots), axis=1)
             for i in range(n_remaining_slots):
                 future = executor.submit(
                     _permutation_montecarlo_one_step,
                     u,
                     truncation,
-                    algorithm,
                     seed=seeds[i],
+                    antithetic=antithetic,
+                    positions=all_positions[i],
                 )
                 pending.add(future)
+                order[future] = n_submitted
+                n_submitted += 1
 
 
 def _combinatorial_montecarlo_shapley(
@@ -277,33 +368,77 @@ def _combinatorial_montecarlo_shapley(
     Returns:
         The results for the indices.
     """
-    n = len(u.data)
+    all_indices = u.data.indices
+    n = len(all_indices)
 
     # Correction coming from Monte Carlo integration so that the mean of the
     # marginals converges to the value: the uniform distribution over the
     # powerset of a set with n-1 elements has mass 2^{n-1} over each subset. The
-    # additional factor n corresponds to the one in the Shapley definition
-    correction = 2 ** (n - 1) / n
+    # additional factor n corresponds to the one in the Shapley definition.
+    # Kept in log space, since 2^{n-1} overflows a float for large n.
+    log_correction = (n - 1) * math.log(2) - math.log(n)
+    # correction / comb(n-1, k) for every subset size k
+    ks = np.arange(n)
+    # For n > 1024 the weights of the smallest and largest sizes overflow to
+    # inf. Subsets of these sizes have vanishing probability of being sampled,
+    # so only the warning is silenced.
+    with np.errstate(over="ignore"):
+        weight_table = np.exp(
+            log_correction - gammaln(n) + gammaln(ks + 1) + gammaln(n - ks)
+        )
     result = ValuationResult.zeros(
         algorithm="combinatorial_montecarlo_shapley",
         indices=np.array(indices, dtype=np.int_),
-        data_names=[u.data.data_names[i] for i in indices],
+        data_names=u.data.data_names[indices],
     )
 
     rng = np.random.default_rng(seed)
 
-    for idx in repeat_indices(
-        indices,
-        result=result,  # type:ignore
-        done=done,  # type:ignore
-        disable=not progress,
-        position=job_id,
+    # Membership masks for subsets of the complement of each index are sampled
+    # in blocks, instead of one Bernoulli vector per iteration. The weights of
+    # the marginals only depend on the subset sizes, so they are looked up for
+    # the whole block at once, leaving only the utility in the loop. The
+    # marginals of a block are then added to the result in one go. Blocks
+    # never span more than one cycle over the indices, so these are unique.
+    block_size = max(1, min(len(indices), _MAX_MASK_BLOCK_ENTRIES // n))
+    masks = np.empty((0, n - 1), dtype=bool)
+    weights = np.empty(0, dtype=np.float64)
+    block_indices = np.empty(block_size, dtype=np.int_)
+    marginals = np.empty(block_size, dtype=np.float64)
+    n_pending = 0
+
+    # The complement of each index is selected with a membership mask, instead
+    # of a set difference with the full dataset for every sample.
+    positions = {idx: pos for pos, idx in enumerate(all_indices)}
+    present = np.ones(n, dtype=bool)
+
+    for k, idx in enumerate(
+        repeat_indices(
+            indices,
+            result=result,  # type:ignore
+            done=done,  # type:ignore
+            disable=not progress,
+            position=job_id,
+        )
     ):
+        j = k % block_size
+        if j == 0:
+            masks = rng.random((block_size, n - 1)) < 0.5
+            weights = weight_table[masks.sum(axis=1)]
         # Randomly sample subsets of full dataset without idx
-        subset = np.setxor1d(u.data.indices, [idx], assume_unique=True)
-        s = next(random_powerset(subset, n_samples=1, seed=rng))
-        marginal = (u({idx}.union(s)) - u(s)) / math.comb(n - 1, len(s))
-        result.update(idx, correction * marginal)
+        pos = positions[idx]
+        present[pos] = False
+        s = all_indices[present][masks[j]]
+        present[pos] = True
+        block_indices[j] = idx
+        marginals[j] = weights[j] * (u({idx}.union(s)) - u(s))
+        n_pending = j + 1
+        if n_pending == block_size:
+            result.update_many(block_indices, marginals)
+            n_pending = 0
+
+    # Only left over if stopping did not depend on the updates, e.g. a timeout
+    result.update_many(block_indices[:n_pending], marginals[:n_pending])
 
     return result
 
@@ -371,7 +506,7 @@ def combinatorial_montecarlo_shapley(
     map_reduce_job: MapReduceJob[NDArray, ValuationResult] = MapReduceJob(
         u.data.indices,
         map_func=_combinatorial_montecarlo_shapley,
-        reduce_func=lambda results: reduce(operator.add, results),
+        reduce_func=sum_results,
         map_kwargs=dict(u=u, done=done, progress=progress),
         n_jobs=n_jobs,
         parallel_backend=parallel_backend,
@@ -6,9 +6,7 @@
     In: 2020 25th International Conference on Pattern Recognition (ICPR), pp. 7992–7999. IEEE.
 """
 
-import operator
 from enum import Enum
-from functools import reduce
 from typing import Optional, Sequence
 
 import numpy as np
@@ -21,10 +19,10 @@ from pydvl.parallel import (
     ParallelConfig,
     _maybe_init_parallel_backend,
 )
-from pydvl.utils import Utility, random_powerset
+from pydvl.utils import SubsetCache, Utility
 from pydvl.utils.progress import repeat_indices
 from pydvl.utils.types import Seed
-from pydvl.value.result import ValuationResult
+from pydvl.value.result import ValuationResult, sum_results
 from pydvl.value.stopping import MinUpdates
 
 __all__ = ["OwenAlgorithm", "owen_sampling_shapley"]
@@ -42,6 +40,22 @@ class OwenAlgorithm(Enum):
     Antithetic = "antithetic"
 
 
+def _marginals(
+    u: SubsetCache, indices: NDArray[np.int_], masks: NDArray[np.bool_], pos: int
+) -> NDArray[np.float64]:
+    """Computes the marginal utilities of `indices[pos]` with respect to each of
+    the subsets of `indices` selected by the rows of `masks`, none of which may
+    contain it.
+
+    The masks are temporarily modified in place to evaluate the unions.
+    """
+    u_s = u.utilities(indices[mask] for mask in masks)
+    masks[:, pos] = True
+    u_s_i = u.utilities(indices[mask] for mask in masks)
+    masks[:, pos] = False
+    return u_s_i - u_s
+
+
 def _owen_sampling_shapley(
     indices: Sequence[int],
     u: Utility,
@@ -87,6 +101,10 @@ def _owen_sampling_shapley(
     )
 
     rng = np.random.default_rng(seed)
+    cached_u = SubsetCache(u)
+    all_indices = u.data.indices
+    n = len(all_indices)
+    positions = {idx: pos for pos, idx in enumerate(all_indices)}
     done = MinUpdates(1)
 
     for idx in repeat_indices(
@@ -96,17 +114,25 @@ def _owen_sampling_shapley(
         disable=not progress,
         position=job_id,
     ):
-        e = np.zeros(max_q)
-        subset = np.setxor1d(u.data.indices, [idx], assume_unique=True)
+        # Subsets are represented as membership masks over all indices, with
+        # the position of idx always cleared
+        pos = positions[idx]
+        e = np.empty(max_q, dtype=np.float64)
         for j, q in enumerate(q_steps):
-            for s in random_powerset(subset, n_samples=n_samples, q=q, seed=rng):
-                marginal = u({idx}.union(s)) - u(s)
-                if method == OwenAlgorithm.Antithetic:
-                    s_complement = np.setxor1d(subset, s, assume_unique=True)
-                    marginal += u({idx}.union(s_complement)) - u(s_complement)
-                    marginal /= 2
-                e[j] += marginal
-        e /= n_samples
+            # Bernoulli draws for all samples at this q. Sampling one q at a
+            # time bounds memory by n_samples * n, independently of max_q
+            masks = rng.random((n_samples, n)) < q
+            masks[:, pos] = False
+            # Only the utility is evaluated sample by sample, the rest is vectorized
+            marginals = _marginals(cached_u, all_indices, masks, pos)
+            if method == OwenAlgorithm.Antithetic:
+                # The masks are not needed anymore: flip them in place into the
+                # complements, instead of allocating these
+                np.logical_not(masks, out=masks)
+                masks[:, pos] = False
+                marginals += _marginals(cached_u, all_indices, masks, pos)
+                marginals /= 2
+            e[j] = marginals.mean()
         result.update(idx, e.mean())
         # Trapezoidal rule
         # TODO: investigate whether this or other quadrature rules are better
@@ -207,7 +233,7 @@ def owen_sampling_shapley(
     map_reduce_job: MapReduceJob[NDArray, ValuationResult] = MapReduceJob(
         u.data.indices,
         map_func=_owen_sampling_shapley,
-        reduce_func=lambda results: reduce(operator.add, results),
+        reduce_func=sum_results,
         map_kwargs=dict(
             u=u,
             method=OwenAlgorithm(method),
@@ -90,8 +90,7 @@ def linear_hessian_analytical(
     """
     A, b = linear_model
     n, m = tuple(A.shape)
-    d2_theta = np.einsum("ia,ib->iab", x, x)
-    d2_theta = np.mean(d2_theta, axis=0)
+    d2_theta = x.T @ x / len(x)
     d2_theta = np.kron(np.eye(n), d2_theta)
     d2_b = np.eye(n)
     mean_x = np.mean(x, axis=0, keepdims=True)
@@ -237,14 +236,14 @@ def analytical_linear_influences(
             x,
             y,
         )
-        result = np.einsum("ia,ja->ij", s_test_analytical, train_grads_analytical)
+        result = s_test_analytical @ train_grads_analytical.T
     elif mode == InfluenceMode.Perturbation:
         train_second_deriv_analytical = linear_mixed_second_derivative_analytical(
             linear_model,
             x,
             y,
         )
-        result = np.einsum(
-            "ia,jab->ijb", s_test_analytical, train_second_deriv_analytical
+        result = np.tensordot(
+            s_test_analytical, train_second_deriv_analytical, axes=(1, 1)
         )
     return result
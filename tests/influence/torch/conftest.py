@@ -44,9 +44,11 @@ def minimal_training(
     model = model.train()
     optimizer = LBFGS(model.parameters(), lr=lr)
 
+    # Training is full batch, so the data is collated once for all epochs
+    data = torch.cat([inputs for inputs, targets in dataloader])
+    targets = torch.cat([targets for inputs, targets in dataloader])
+
     for epoch in range(epochs):
-        data = torch.cat([inputs for inputs, targets in dataloader])
-        targets = torch.cat([targets for inputs, targets in dataloader])
 
         def closure():
             optimizer.zero_grad()
@@ -4,7 +4,6 @@ from typing import Callable, Dict, NamedTuple, OrderedDict, Tuple
 import numpy as np
 import pytest
 from numpy.typing import NDArray
-from scipy.stats import pearsonr, spearmanr
 
 from pydvl.influence.base_influence_function_model import (
     NotImplementedLayerRepresentationException,
@@ -32,7 +31,7 @@ torch = pytest.importorskip("torch")
 
 import torch  # noqa: F811
 import torch.nn.functional as F
-from pytest_cases import fixture, parametrize, parametrize_with_cases
+from pytest_cases import case, fixture, parametrize, parametrize_with_cases
 from torch import nn
 from torch.utils.data import DataLoader, TensorDataset
 
@@ -105,8 +104,26 @@ class TestCase(NamedTuple):
     test_data_len: int = 10
     batch_size: int = 10
 
+    @property
+    def train_input_shape(self) -> Tuple[int, ...]:
+        return (self.train_data_len, *self.input_dim)
+
+    @property
+    def test_input_shape(self) -> Tuple[int, ...]:
+        return (self.test_data_len, *self.input_dim)
+
+    @property
+    def influences_shape(self) -> Tuple[int, ...]:
+        if self.mode == InfluenceMode.Perturbation:
+            return (self.test_data_len, *self.train_input_shape)
+        return (self.test_data_len, self.train_data_len)
+
 
 class InfluenceTestCases:
+    # Each case trains its own model in the module scoped fixtures. With
+    # `--dist loadgroup`, all tests of a case run on the same xdist worker so
+    # that the model is trained only once
+    @case(marks=pytest.mark.xdist_group("conv3d_nn_up"))
     def case_conv3d_nn_up(self) -> TestCase:
         return TestCase(
             module_factory=create_conv3d_nn,
@@ -116,6 +133,7 @@ class InfluenceTestCases:
             mode=InfluenceMode.Up,
         )
 
+    @case(marks=pytest.mark.xdist_group("conv3d_nn_pert"))
     def case_conv3d_nn_pert(self) -> TestCase:
         return TestCase(
             module_factory=create_conv3d_nn,
@@ -125,6 +143,7 @@ class InfluenceTestCases:
             mode=InfluenceMode.Perturbation,
         )
 
+    @case(marks=pytest.mark.xdist_group("conv2d_nn_up"))
     def case_conv2d_nn_up(self) -> TestCase:
         return TestCase(
             module_factory=create_conv2d_nn,
@@ -134,6 +153,7 @@ class InfluenceTestCases:
             mode=InfluenceMode.Up,
         )
 
+    @case(marks=pytest.mark.xdist_group("conv2d_nn_pert"))
     def case_conv2d_nn_pert(self) -> TestCase:
         return TestCase(
             module_factory=create_conv2d_nn,
@@ -143,6 +163,7 @@ class InfluenceTestCases:
             mode=InfluenceMode.Perturbation,
         )
 
+    @case(marks=pytest.mark.xdist_group("conv1d_nn_up"))
     def case_conv1d_nn_up(self) -> TestCase:
         return TestCase(
             module_factory=create_conv1d_nn,
@@ -152,6 +173,7 @@ class InfluenceTestCases:
             mode=InfluenceMode.Up,
         )
 
+    @case(marks=pytest.mark.xdist_group("conv1d_nn_pert"))
     def case_conv1d_nn_pert(self) -> TestCase:
         return TestCase(
             module_factory=create_conv1d_nn,
@@ -161,6 +183,7 @@ class InfluenceTestCases:
             mode=InfluenceMode.Perturbation,
         )
 
+    @case(marks=pytest.mark.xdist_group("simple_nn_up"))
     def case_simple_nn_up(self) -> TestCase:
         return TestCase(
             module_factory=create_simple_nn_regr,
@@ -170,6 +193,7 @@ class InfluenceTestCases:
             mode=InfluenceMode.Up,
         )
 
+    @case(marks=pytest.mark.xdist_group("simple_nn_pert"))
     def case_simple_nn_pert(self) -> TestCase:
         return TestCase(
             module_factory=create_simple_nn_regr,
@@ -179,6 +203,7 @@ class InfluenceTestCases:
             mode=InfluenceMode.Perturbation,
         )
 
+    @case(marks=pytest.mark.xdist_group("conv1d_no_grad_up"))
     def case_conv1d_no_grad_up(self) -> TestCase:
         return TestCase(
             module_factory=create_conv1d_no_grad,
@@ -188,6 +213,7 @@ class InfluenceTestCases:
             mode=InfluenceMode.Up,
         )
 
+    @case(marks=pytest.mark.xdist_group("simple_nn_class_up"))
     def case_simple_nn_class_up(self) -> TestCase:
         return TestCase(
             module_factory=create_simple_nn_no_grad,
@@ -200,7 +226,7 @@ class InfluenceTestCases:
         )
 
 
-@fixture
+@fixture(scope="module")
 @parametrize_with_cases(
     "case",
     cases=InfluenceTestCases,
@@ -210,9 +236,10 @@ def test_case(case: TestCase) -> TestCase:
     return case
 
 
-@fixture
+@fixture(scope="module")
 def model_and_data(
     test_case: TestCase,
+    device: torch.device,
 ) -> Tuple[
     torch.nn.Module,
     Callable[[torch.Tensor, torch.Tensor], torch.Tensor],
@@ -221,24 +248,43 @@ def model_and_data(
     torch.Tensor,
     torch.Tensor,
 ]:
-    x_train = torch.rand((test_case.train_data_len, *test_case.input_dim))
-    x_test = torch.rand((test_case.test_data_len, *test_case.input_dim))
+    # Trained once per test case and shared by all tests in the module. Module
+    # scoped fixtures are set up before the autouse seeding of each test, so
+    # seed explicitly (with the default of the `seed` fixture)
+    torch.manual_seed(24)
+    # Generated directly on the device, where all influence computations run
+    x_train = torch.rand(test_case.train_input_shape, device=device)
+    x_test = torch.rand(test_case.test_input_shape, device=device)
     if isinstance(test_case.loss, nn.CrossEntropyLoss):
         y_train = torch.randint(
-            0, test_case.output_dim, (test_case.train_data_len,), dtype=torch.long
+            0,
+            test_case.output_dim,
+            (test_case.train_data_len,),
+            dtype=torch.long,
+            device=device,
         )
         y_test = torch.randint(
-            0, test_case.output_dim, (test_case.test_data_len,), dtype=torch.long
+            0,
+            test_case.output_dim,
+            (test_case.test_data_len,),
+            dtype=torch.long,
+            device=device,
         )
     else:
-        y_train = torch.rand((test_case.train_data_len, test_case.output_dim))
-        y_test = torch.rand((test_case.test_data_len, test_case.output_dim))
+        y_train = torch.rand(
+            (test_case.train_data_len, test_case.output_dim), device=device
+        )
+        y_test = torch.rand(
+            (test_case.test_data_len, test_case.output_dim), device=device
+        )
 
     train_dataloader = DataLoader(
         TensorDataset(x_train, y_train), batch_size=test_case.batch_size
     )
 
-    model = test_case.module_factory()
+    # Trained eagerly: for models this small, the warmup of torch.compile takes
+    # longer than the whole training
+    model = test_case.module_factory().to(device)
     model = minimal_training(
         model, train_dataloader, test_case.loss, lr=0.3, epochs=100
     )
@@ -246,24 +292,31 @@ def model_and_data(
     return model, test_case.loss, x_train, y_train, x_test, y_test
 
 
-@fixture
+@fixture(scope="module")
+def train_dataloader(model_and_data, test_case: TestCase) -> DataLoader:
+    model, loss, x_train, y_train, x_test, y_test = model_and_data
+    return DataLoader(TensorDataset(x_train, y_train), batch_size=test_case.batch_size)
+
+
+@fixture(scope="module")
 def block_structure(request):
     return getattr(request, "param", BlockMode.FULL)
 
 
-@fixture
+@fixture(scope="module")
 def second_order_mode(request):
     return getattr(request, "param", SecondOrderMode.HESSIAN)
 
 
-@fixture
+@fixture(scope="module")
 def direct_influence_function_model(
-    model_and_data, test_case: TestCase, block_structure: BlockMode, second_order_mode
+    model_and_data,
+    train_dataloader: DataLoader,
+    test_case: TestCase,
+    block_structure: BlockMode,
+    second_order_mode,
 ):
     model, loss, x_train, y_train, x_test, y_test = model_and_data
-    train_dataloader = DataLoader(
-        TensorDataset(x_train, y_train), batch_size=test_case.batch_size
-    )
     return DirectInfluence(
         model,
         loss,
@@ -273,7 +326,7 @@ def direct_influence_function_model(
     ).fit(train_dataloader)
 
 
-@fixture
+@fixture(scope="module")
 def direct_influences(
     direct_influence_function_model: DirectInfluence,
     model_and_data,
@@ -285,7 +338,7 @@ def direct_influences(
     )
 
 
-@fixture
+@fixture(scope="module")
 def direct_influences_by_block(
     direct_influence_function_model: DirectInfluence,
     model_and_data,
@@ -297,7 +350,7 @@ def direct_influences_by_block(
     )
 
 
-@fixture
+@fixture(scope="module")
 def direct_sym_influences(
     direct_influence_function_model: DirectInfluence,
     model_and_data,
@@ -309,7 +362,7 @@ def direct_sym_influences(
     )
 
 
-@fixture
+@fixture(scope="module")
 def direct_factors(
     direct_influence_function_model: DirectInfluence,
     model_and_data,
@@ -319,7 +372,7 @@ def direct_factors(
     return direct_influence_function_model.influence_factors(x_train, y_train)
 
 
-@fixture
+@fixture(scope="module")
 def direct_factors_by_block(
     direct_influence_function_model: DirectInfluence,
     model_and_data,
@@ -329,7 +382,7 @@ def direct_factors_by_block(
     return direct_influence_function_model.influence_factors_by_block(x_train, y_train)
 
 
-@fixture
+@fixture(scope="module")
 def direct_influences_from_factors_by_block(
     direct_influence_function_model: DirectInfluence,
     direct_factors_by_block,
@@ -342,7 +395,7 @@ def direct_influences_from_factors_by_block(
     )
 
 
-@fixture
+@fixture(scope="module")
 def direct_influences_from_factors(
     direct_influence_function_model: DirectInfluence,
     direct_factors,
@@ -355,26 +408,33 @@ def direct_influences_from_factors(
     )
 
 
-@pytest.mark.parametrize(
-    "mode",
-    InfluenceMode,
-    ids=[ifl.value for ifl in InfluenceMode],
-)
-@pytest.mark.parametrize(
-    "train_set_size",
-    [200],
-    ids=["train_set_size_200"],
-)
-@pytest.mark.parametrize(
-    ["influence_factory", "rtol"],
+LINEAR_HESSIAN_REG = 0.1
+
+
+@fixture(scope="module")
+@parametrize("train_set_size", [200], ids=["train_set_size_200"])
+def linear_problem(train_set_size: int):
+    # Module scoped fixtures are set up before the autouse seeding of each test,
+    # so seed explicitly (with the default of `seed_numpy`)
+    np.random.seed(42)
+    A, b = linear_model(problem_dimension=(4, 20), condition_number=2)
+    train_data, test_data = add_noise_to_linear_model(
+        (A, b), train_set_size, test_set_size=20
+    )
+    return (A, b), train_data, test_data
+
+
+@fixture(scope="module")
+@parametrize(
+    "influence_factory, rtol",
     [
-        [
+        (
             lambda model, loss, train_dataLoader, hessian_reg: CgInfluence(
                 model, loss, regularization=hessian_reg
             ).fit(train_dataLoader),
             1e-1,
-        ],
-        [
+        ),
+        (
             lambda model, loss, train_dataLoader, hessian_reg: LissaInfluence(
                 model,
                 loss,
@@ -383,16 +443,16 @@ def direct_influences_from_factors(
                 scale=100,
             ).fit(train_dataLoader),
             0.3,
-        ],
-        [
+        ),
+        (
             lambda model, loss, train_dataLoader, hessian_reg: DirectInfluence(
                 model,
                 loss,
                 hessian_reg,
             ).fit(train_dataLoader),
             1e-4,
-        ],
-        [
+        ),
+        (
             lambda model, loss, train_dataLoader, hessian_reg: CgInfluence(
                 model,
                 loss,
@@ -401,65 +461,82 @@ def direct_influences_from_factors(
                 solve_simultaneously=True,
             ).fit(train_dataLoader),
             1e-4,
-        ],
+        ),
     ],
     ids=["cg", "lissa", "direct", "block-cg"],
 )
-def test_influence_linear_model(
+def linear_influence(
     influence_factory: Callable,
-    rtol,
-    mode: InfluenceMode,
-    train_set_size: int,
+    rtol: float,
+    linear_problem,
     device: torch.device,
-    hessian_reg: float = 0.1,
-    test_set_size: int = 20,
-    problem_dimension: Tuple[int, int] = (4, 20),
-    condition_number: float = 2,
 ):
-    A, b = linear_model(problem_dimension, condition_number)
-    train_data, test_data = add_noise_to_linear_model(
-        (A, b), train_set_size, test_set_size
-    )
+    # Fitted once and shared by all influence modes
+    torch.manual_seed(24)
+    (A, b), train_data, test_data = linear_problem
 
-    linear_layer = nn.Linear(A.shape[0], A.shape[1])
+    # Kept in double precision, like the data: single precision is not enough
+    # to match the analytical perturbation influences at rtol=1e-4
+    linear_layer = nn.Linear(A.shape[1], A.shape[0], dtype=torch.float64)
     linear_layer.eval()
     linear_layer.weight.data = torch.as_tensor(A)
     linear_layer.bias.data = torch.as_tensor(b)
-    loss = F.mse_loss
 
-    analytical_influences = analytical_linear_influences(
-        (A, b),
-        *train_data,
-        *test_data,
-        mode=mode,
-        hessian_regularization=hessian_reg,
-    )
-    sym_analytical_influences = analytical_linear_influences(
-        (A, b),
-        *train_data,
-        *train_data,
-        mode=mode,
-        hessian_regularization=hessian_reg,
-    )
+    x_train, y_train = tuple(torch.from_numpy(t).to(device) for t in train_data)
+    x_test, y_test = tuple(torch.from_numpy(t).to(device) for t in test_data)
 
-    train_data_set = TensorDataset(*list(map(torch.from_numpy, train_data)))
-    train_data_loader = DataLoader(train_data_set, batch_size=40, num_workers=0)
-    influence = influence_factory(
-        linear_layer.to(device), loss, train_data_loader, hessian_reg
+    train_data_loader = DataLoader(
+        TensorDataset(x_train, y_train), batch_size=40, num_workers=0
     )
+    influence = influence_factory(
+        linear_layer.to(device), F.mse_loss, train_data_loader, LINEAR_HESSIAN_REG
+    )
+    return influence, rtol, (x_train, y_train), (x_test, y_test)
+
+
+@fixture(scope="module")
+def analytical_influences(
+    linear_problem,
+) -> Dict[InfluenceMode, Tuple[NDArray, ...]]:
+    # Test and symmetric train influences for all modes. They do not depend on
+    # the influence model, so they are shared by all factories
+    (A, b), train_data, test_data = linear_problem
+    return {
+        mode: tuple(
+            analytical_linear_influences(
+                (A, b),
+                *train_data,
+                *data,
+                mode=mode,
+                hessian_regularization=LINEAR_HESSIAN_REG,
+            )
+            for data in (test_data, train_data)
+        )
+        for mode in InfluenceMode
+    }
 
-    x_train, y_train = tuple(map(torch.from_numpy, train_data))
-    x_test, y_test = tuple(map(torch.from_numpy, test_data))
-    influence_values = (
-        (influence.influences(x_test, y_test, x_train, y_train, mode=mode))
-        .cpu()
-        .numpy()
-    )
-    sym_influence_values = (
-        influence.influences(x_train, y_train, x_train, y_train, mode=mode)
-        .cpu()
-        .numpy()
+
+@pytest.mark.parametrize(
+    "mode",
+    InfluenceMode,
+    ids=[ifl.value for ifl in InfluenceMode],
+)
+def test_influence_linear_model(
+    mode: InfluenceMode,
+    linear_influence,
+    analytical_influences,
+):
+    influence, rtol, (x_train, y_train), (x_test, y_test) = linear_influence
+    analytical_test_influences, sym_analytical_influences = analytical_influences[mode]
+
+    influence_values = influence.influences(x_test, y_test, x_train, y_train, mode=mode)
+    sym_influence_values = influence.influences(
+        x_train, y_train, x_train, y_train, mode=mode
     )
+    assert torch.isfinite(influence_values).all()
+    assert torch.isfinite(sym_influence_values).all()
+    influence_values = influence_values.cpu().numpy()
+    sym_influence_values = sym_influence_values.cpu().numpy()
 
     with pytest.raises(ValueError):
         influence.influences(x_test, y_test, x=x_train, mode=mode)
@@ -475,9 +552,7 @@ def test_influence_linear_model(
             rtol=rtol,
         )
 
-    assert np.logical_not(np.any(np.isnan(influence_values)))
-    assert np.logical_not(np.any(np.isnan(sym_influence_values)))
-    assert upper_quantile_equivalence(influence_values, analytical_influences, 0.9)
+    assert upper_quantile_equivalence(influence_values, analytical_test_influences, 0.9)
     assert upper_quantile_equivalence(
         sym_influence_values, sym_analytical_influences, 0.9
     )
@@ -506,15 +581,12 @@ def test_influences_lissa(
         torch.Tensor,
         torch.Tensor,
     ],
+    train_dataloader: DataLoader,
     direct_influences,
     influence_factory,
     device,
 ):
     model, loss, x_train, y_train, x_test, y_test = model_and_data
-
-    train_dataloader = DataLoader(
-        TensorDataset(x_train, y_train), batch_size=test_case.batch_size
-    )
     influence_model = influence_factory(
         model.to(device), loss, train_dataloader, test_case.hessian_reg
     )
@@ -533,34 +605,19 @@ def test_influences_lissa(
         influences_from_factors, approx_influences, atol=atol, rtol=rtol
     )
 
-    approx_influences = approx_influences.cpu().numpy()
+    assert torch.isfinite(approx_influences).all()
 
-    assert not np.any(np.isnan(approx_influences))
+    approx_influences = approx_influences.cpu().numpy()
 
     np.testing.assert_allclose(
-        approx_influences, direct_influences, atol=atol, rtol=rtol
+        approx_influences, direct_influences.cpu(), atol=atol, rtol=rtol
     )
 
-    if test_case.mode == InfluenceMode.Up:
-        assert approx_influences.shape == (
-            test_case.test_data_len,
-            test_case.train_data_len,
-        )
-
-    if test_case.mode == InfluenceMode.Perturbation:
-        assert approx_influences.shape == (
-            test_case.test_data_len,
-            test_case.train_data_len,
-            *test_case.input_dim,
-        )
+    assert approx_influences.shape == test_case.influences_shape
 
     # check that influences are not all constant
     assert not np.all(approx_influences == approx_influences.item(0))
 
-    np.testing.assert_allclose(
-        approx_influences, direct_influences, atol=atol, rtol=rtol
-    )
-
 
 @pytest.mark.parametrize(
     "influence_factory",
@@ -587,6 +644,7 @@ def test_influences_low_rank(
         torch.Tensor,
         torch.Tensor,
     ],
+    train_dataloader: DataLoader,
     direct_influences,
     direct_sym_influences,
     direct_factors,
@@ -599,10 +657,9 @@ def test_influences_low_rank(
 
     num_parameters = sum(p.numel() for p in model.parameters() if p.requires_grad)
 
-    train_dataloader = DataLoader(
-        TensorDataset(x_train, y_train), batch_size=test_case.batch_size
-    )
-
+    # The comparison with direct influences at the tolerances above needs
+    # (almost) the full spectrum: truncating the rank to a few dozen eigenpairs
+    # already breaks it for the convolutional models
     influence_func_model = influence_factory(
         model.to(device),
         loss,
@@ -620,45 +677,53 @@ def test_influences_low_rank(
 
     influence_func_model = influence_func_model.fit(train_dataloader)
 
-    low_rank_influence = influence_func_model.influences(
-        x_test, y_test, x_train, y_train, mode=test_case.mode
-    )
+    # The fitted operator is applied without autograd bookkeeping
+    with torch.inference_mode():
+        low_rank_influence = influence_func_model.influences(
+            x_test, y_test, x_train, y_train, mode=test_case.mode
+        )
 
-    sym_low_rank_influence = influence_func_model.influences(
-        x_train, y_train, mode=test_case.mode
-    )
+        sym_low_rank_influence = influence_func_model.influences(
+            x_train, y_train, mode=test_case.mode
+        )
 
-    np.testing.assert_allclose(
-        direct_factors,
-        influence_func_model.influence_factors(x_train, y_train),
-        atol=atol,
-        rtol=rtol,
-    )
+        np.testing.assert_allclose(
+            direct_factors.cpu(),
+            influence_func_model.influence_factors(x_train, y_train).cpu(),
+            atol=atol,
+            rtol=rtol,
+        )
+
+        if test_case.mode is InfluenceMode.Up:
+            low_rank_influence_transpose = influence_func_model.influences(
+                x_train, y_train, x_test, y_test, mode=test_case.mode
+            )
+            np.testing.assert_allclose(
+                low_rank_influence_transpose.cpu(),
+                low_rank_influence.swapaxes(0, 1).cpu(),
+                atol=atol,
+                rtol=rtol,
+            )
 
-    if test_case.mode is InfluenceMode.Up:
-        low_rank_influence_transpose = influence_func_model.influences(
-            x_train, y_train, x_test, y_test, mode=test_case.mode
+        low_rank_factors = influence_func_model.influence_factors(x_test, y_test)
+        low_rank_values_from_factors = influence_func_model.influences_from_factors(
+            low_rank_factors, x_train, y_train, mode=test_case.mode
+        )
+        np.testing.assert_allclose(
+            direct_influences.cpu(), low_rank_influence.cpu(), atol=atol, rtol=rtol
         )
         np.testing.assert_allclose(
-            low_rank_influence_transpose,
-            low_rank_influence.swapaxes(0, 1),
+            direct_sym_influences.cpu(),
+            sym_low_rank_influence.cpu(),
+            atol=atol,
+            rtol=rtol,
+        )
+        np.testing.assert_allclose(
+            low_rank_influence.cpu(),
+            low_rank_values_from_factors.cpu(),
             atol=atol,
             rtol=rtol,
         )
-
-    low_rank_factors = influence_func_model.influence_factors(x_test, y_test)
-    low_rank_values_from_factors = influence_func_model.influences_from_factors(
-        low_rank_factors, x_train, y_train, mode=test_case.mode
-    )
-    np.testing.assert_allclose(
-        direct_influences, low_rank_influence, atol=atol, rtol=rtol
-    )
-    np.testing.assert_allclose(
-        direct_sym_influences, sym_low_rank_influence, atol=atol, rtol=rtol
-    )
-    np.testing.assert_allclose(
-        low_rank_influence, low_rank_values_from_factors, atol=atol, rtol=rtol
-    )
 
     with pytest.raises(ValueError):
         influence_func_model.influences(x_test, y_test, x=x_train, mode=test_case.mode)
@@ -676,6 +741,7 @@ def test_influences_ekfac(
         torch.Tensor,
         torch.Tensor,
     ],
+    train_dataloader: DataLoader,
     direct_influences,
     direct_sym_influences,
     device: torch.device,
@@ -685,10 +751,6 @@ def test_influences_ekfac(
 
     model, loss, x_train, y_train, x_test, y_test = model_and_data
 
-    train_dataloader = DataLoader(
-        TensorDataset(x_train, y_train), batch_size=test_case.batch_size
-    )
-
     ekfac_influence = EkfacInfluence(
         model,
         update_diagonal=True,
@@ -708,37 +770,38 @@ def test_influences_ekfac(
             ekfac_influence.fit(train_dataloader)
     elif isinstance(loss, nn.CrossEntropyLoss):
         ekfac_influence = ekfac_influence.fit(train_dataloader)
-        ekfac_influence_values = (
-            ekfac_influence.influences(
-                x_test, y_test, x_train, y_train, mode=test_case.mode
+        with torch.inference_mode():
+            ekfac_influence_values = (
+                ekfac_influence.influences(
+                    x_test, y_test, x_train, y_train, mode=test_case.mode
+                )
+                .cpu()
+                .numpy()
             )
-            .cpu()
-            .numpy()
-        )
 
-        ekfac_influences_by_layer = ekfac_influence.influences_by_layer(
-            x_test, y_test, x_train, y_train, mode=test_case.mode
-        )
+            ekfac_influences_by_layer = ekfac_influence.influences_by_layer(
+                x_test, y_test, x_train, y_train, mode=test_case.mode
+            )
 
-        accumulated_inf_by_layer = np.zeros_like(ekfac_influence_values)
-        for layer, infl in ekfac_influences_by_layer.items():
-            accumulated_inf_by_layer += infl.detach().cpu().numpy()
+            accumulated_inf_by_layer = np.zeros_like(ekfac_influence_values)
+            for layer, infl in ekfac_influences_by_layer.items():
+                accumulated_inf_by_layer += infl.detach().cpu().numpy()
 
-        ekfac_self_influence = (
-            ekfac_influence.influences(x_train, y_train, mode=test_case.mode)
-            .cpu()
-            .numpy()
-        )
+            ekfac_self_influence = (
+                ekfac_influence.influences(x_train, y_train, mode=test_case.mode)
+                .cpu()
+                .numpy()
+            )
 
-        ekfac_factors = ekfac_influence.influence_factors(x_test, y_test)
+            ekfac_factors = ekfac_influence.influence_factors(x_test, y_test)
 
-        influence_from_factors = (
-            ekfac_influence.influences_from_factors(
-                ekfac_factors, x_train, y_train, mode=test_case.mode
+            influence_from_factors = (
+                ekfac_influence.influences_from_factors(
+                    ekfac_factors, x_train, y_train, mode=test_case.mode
+                )
+                .cpu()
+                .numpy()
             )
-            .cpu()
-            .numpy()
-        )
 
         np.testing.assert_allclose(
             ekfac_influence_values, influence_from_factors, atol=atol, rtol=rtol
@@ -747,10 +810,10 @@ def test_influences_ekfac(
             ekfac_influence_values, accumulated_inf_by_layer, atol=atol, rtol=rtol
         )
         check_influence_correlations(
-            direct_influences.numpy(), ekfac_influence_values, threshold=0.94
+            direct_influences.cpu().numpy(), ekfac_influence_values, threshold=0.94
         )
         check_influence_correlations(
-            direct_sym_influences.numpy(), ekfac_self_influence, threshold=0.94
+            direct_sym_influences.cpu().numpy(), ekfac_self_influence, threshold=0.94
         )
 
 
@@ -774,6 +837,7 @@ def test_influences_cg(
         torch.Tensor,
         torch.Tensor,
     ],
+    train_dataloader: DataLoader,
     direct_influences,
     direct_factors,
     use_block_cg: bool,
@@ -781,10 +845,6 @@ def test_influences_cg(
     device: torch.device,
 ):
     model, loss, x_train, y_train, x_test, y_test = model_and_data
-
-    train_dataloader = DataLoader(
-        TensorDataset(x_train, y_train), batch_size=test_case.batch_size
-    )
     influence_model = CgInfluence(
         model.to(device),
         loss,
@@ -806,34 +866,19 @@ def test_influences_cg(
 
     assert torch.allclose(influences_from_factors, approx_influences, rtol=1e-4)
 
-    approx_influences = approx_influences.cpu().numpy()
+    assert torch.isfinite(approx_influences).all()
 
-    assert not np.any(np.isnan(approx_influences))
+    approx_influences = approx_influences.cpu().numpy()
 
     np.testing.assert_allclose(
-        approx_influences, direct_influences, atol=1e-6, rtol=1e-4
+        approx_influences, direct_influences.cpu(), atol=1e-6, rtol=1e-4
     )
 
-    if test_case.mode == InfluenceMode.Up:
-        assert approx_influences.shape == (
-            test_case.test_data_len,
-            test_case.train_data_len,
-        )
-
-    if test_case.mode == InfluenceMode.Perturbation:
-        assert approx_influences.shape == (
-            test_case.test_data_len,
-            test_case.train_data_len,
-            *test_case.input_dim,
-        )
+    assert approx_influences.shape == test_case.influences_shape
 
     # check that influences are not all constant
     assert not np.all(approx_influences == approx_influences.item(0))
 
-    np.testing.assert_allclose(
-        approx_influences, direct_influences, atol=1e-6, rtol=1e-4
-    )
-
     # check that block variant returns the correct vector, if only one right hand side
     # is provided
     if use_block_cg:
@@ -845,7 +890,7 @@ def test_influences_cg(
             .numpy()
         )
         np.testing.assert_allclose(
-            single_influence[0], direct_factors[0], atol=1e-6, rtol=1e-4
+            single_influence[0], direct_factors[0].cpu(), atol=1e-6, rtol=1e-4
         )
 
 
@@ -887,6 +932,9 @@ composable_influence_factories = [
 
 
 def check_correlation(arr_1, arr_2, corr_val):
+    from scipy.stats import pearsonr, spearmanr
+
+    arr_1, arr_2 = arr_1.cpu(), arr_2.cpu()
     assert np.all(pearsonr(arr_1, arr_2).statistic > corr_val)
     assert np.all(spearmanr(arr_1, arr_2).statistic > corr_val)
 
@@ -904,6 +952,7 @@ def test_composable_influence(
         torch.Tensor,
         torch.Tensor,
     ],
+    train_dataloader: DataLoader,
     direct_influences,
     direct_sym_influences,
     direct_factors,
@@ -916,10 +965,6 @@ def test_composable_influence(
 ):
     model, loss, x_train, y_train, x_test, y_test = model_and_data
 
-    train_dataloader = DataLoader(
-        TensorDataset(x_train, y_train), batch_size=test_case.batch_size
-    )
-
     infl_model = composable_influence_factory(
         model, loss, test_case.hessian_reg, block_structure=block_structure
     ).to(device)
@@ -8,7 +8,6 @@ from pydvl.influence.torch.operator import MatrixOperator
 
 torch = pytest.importorskip("torch")
 import torch.nn  # noqa: F811
-from scipy.stats import pearsonr, spearmanr
 from torch.nn.functional import mse_loss
 from torch.utils.data import DataLoader, TensorDataset
 
@@ -250,11 +249,22 @@ def test_torch_dataset_to_dask_array(
 
 
 def check_influence_correlations(true_infl, approx_infl, threshold=0.95):
+    from scipy.stats import rankdata
+
     for axis in range(0, true_infl.ndim):
-        mean_true_infl = np.mean(true_infl, axis=axis)
-        mean_approx_infl = np.mean(approx_infl, axis=axis)
-        assert np.all(pearsonr(mean_true_infl, mean_approx_infl).statistic > threshold)
-        assert np.all(spearmanr(mean_true_infl, mean_approx_infl).statistic > threshold)
+        mean_true_infl = np.mean(true_infl, axis=axis).ravel()
+        mean_approx_infl = np.mean(approx_infl, axis=axis).ravel()
+        # Pearson correlations of the values and of their ranks (i.e. Spearman's)
+        corr = np.corrcoef(
+            [
+                mean_true_infl,
+                mean_approx_infl,
+                rankdata(mean_true_infl),
+                rankdata(mean_approx_infl),
+            ]
+        )
+        assert corr[0, 1] > threshold
+        assert corr[2, 3] > threshold
 
 
 def are_active_layers_linear(model):
@@ -6,7 +6,7 @@ import numpy as np
 import pytest
 from sklearn.linear_model import LinearRegression
 
-from pydvl.utils import DataUtilityLearning, Scorer, Utility, powerset
+from pydvl.utils import DataUtilityLearning, Scorer, SubsetCache, Utility, powerset
 from pydvl.utils.caching import CachedFuncConfig, InMemoryCacheBackend
 
 
@@ -138,3 +138,41 @@ def test_utility_serialization(linear_dataset, use_cache):
     assert type(u.scorer) is type(u_unpickled.scorer)
     assert type(u.data) is type(u_unpickled.data)
     assert (u.data.x_train == u_unpickled.data.x_train).all()
+
+
+@pytest.mark.parametrize("a, b, num_points", [(2, 0, 20)])
+def test_subset_cache(linear_dataset):
+    u = Utility(model=LinearRegression(), data=linear_dataset, scorer=Scorer("r2"))
+    cached_u = SubsetCache(u, maxsize=2)
+
+    assert cached_u([2, 0, 1]) == u([0, 1, 2])
+    assert cached_u({1, 2, 0}) == cached_u(np.array([0, 1, 2]))
+    assert (cached_u.hits, cached_u.misses) == (2, 1)
+
+    cached_u([0])
+    cached_u([1])
+    cached_u([0, 1, 2])  # Evicted by the two previous subsets
+    assert (cached_u.hits, cached_u.misses) == (2, 4)
+
+    cached_u.clear()
+    assert (cached_u.hits, cached_u.misses) == (0, 0)
+
+    subsets = [[0, 1], [1, 0], [2]]
+    np.testing.assert_array_equal(cached_u.utilities(subsets), [u(s) for s in subsets])
+    assert (cached_u.hits, cached_u.misses) == (1, 2)
+
+
+@pytest.mark.parametrize("a, b, num_points", [(2, 0, 8)])
+def test_subset_cache_repeated_evaluations(linear_dataset):
+    u = Utility(
+        model=LinearRegression(),
+        data=linear_dataset,
+        scorer=Scorer("r2"),
+        cache_backend=InMemoryCacheBackend(),
+        cached_func_options=CachedFuncConfig(allow_repeated_evaluations=True),
+    )
+    cached_u = SubsetCache(u)
+    cached_u([0, 1])
+    cached_u([0, 1])
+    assert (cached_u.hits, cached_u.misses) == (0, 0)
+    assert u.cache_stats.hits == 1
@@ -1,4 +1,5 @@
 import logging
+import warnings
 from copy import deepcopy
 
 import numpy as np
@@ -6,12 +7,16 @@ import pytest
 from sklearn.linear_model import LinearRegression
 
 from pydvl.parallel.config import ParallelConfig
-from pydvl.utils import GroupedDataset, Status, Utility
+from pydvl.utils import DataUtilityLearning, GroupedDataset, Status, Utility
 from pydvl.utils.numeric import num_samples_permutation_hoeffding
 from pydvl.utils.score import Scorer, squashed_r2
 from pydvl.utils.types import Seed
 from pydvl.value import compute_shapley_values
 from pydvl.value.shapley import ShapleyMode
+from pydvl.value.shapley.montecarlo import (
+    _combinatorial_montecarlo_shapley,
+    permutation_montecarlo_shapley,
+)
 from pydvl.value.shapley.naive import combinatorial_exact_shapley
 from pydvl.value.stopping import MaxChecks, MaxUpdates
 
@@ -33,6 +38,18 @@ log = logging.getLogger(__name__)
     "fun, rtol, atol, kwargs",
     [
         (ShapleyMode.PermutationMontecarlo, 0.2, 1e-4, dict(done=MaxUpdates(500))),
+        (
+            ShapleyMode.PermutationMontecarlo,
+            0.2,
+            1e-4,
+            dict(done=MaxUpdates(500), antithetic=True),
+        ),
+        (
+            ShapleyMode.PermutationMontecarlo,
+            0.2,
+            1e-4,
+            dict(done=MaxUpdates(500), quasi_random=True),
+        ),
         (
             ShapleyMode.CombinatorialMontecarlo,
             0.2,
@@ -264,3 +281,59 @@ def test_grouped_linear_montecarlo_shapley(
     )
 
     check_values(values, exact_values, rtol=rtol)
+
+
+@pytest.mark.parametrize(
+    "test_game",
+    [
+        ("symmetric-voting", {"n_players": 6}),
+    ],
+    indirect=["test_game"],
+)
+def test_permutation_montecarlo_quasi_random_seed(test_game, seed, seed_alt):
+    values_1, values_2, values_3 = call_with_seeds(
+        permutation_montecarlo_shapley,
+        test_game.u,
+        done=MaxUpdates(10),
+        n_jobs=1,
+        quasi_random=True,
+        seeds=(seed, seed, seed_alt),
+    )
+    np.testing.assert_equal(values_1.values, values_2.values)
+    with pytest.raises(AssertionError):
+        np.testing.assert_equal(values_1.values, values_3.values)
+
+
+@pytest.mark.parametrize("a, b, num_points", [(2, 0, 4000)])
+def test_permutation_montecarlo_quasi_random_max_dimension(linear_dataset):
+    u = Utility(LinearRegression(), linear_dataset)
+    with pytest.raises(ValueError):
+        permutation_montecarlo_shapley(u, done=MaxUpdates(1), quasi_random=True)
+
+
+@pytest.mark.parametrize("a, b, num_points", [(2, 0, 8)])
+def test_permutation_montecarlo_wrapped_utility(linear_dataset, seed):
+    """Utilities only need to be callable, e.g. when wrapped for data utility
+    learning."""
+    u = DataUtilityLearning(
+        Utility(LinearRegression(), linear_dataset), 5, LinearRegression()
+    )
+    values = permutation_montecarlo_shapley(
+        u, done=MaxUpdates(2), progress=False, seed=seed
+    )
+    assert len(values) == len(linear_dataset)
+    assert np.all(np.isfinite(values.values))
+
+
+@pytest.mark.parametrize("a, b, num_points", [(2, 0, 4000)])
+def test_combinatorial_montecarlo_many_indices(linear_dataset, seed):
+    """Weights for the extreme subset sizes overflow for more than 1024 indices,
+    which must not warn nor affect the sampled marginals."""
+    u = Utility(LinearRegression(), linear_dataset)
+    assert len(u.data.indices) > 1024
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        values = _combinatorial_montecarlo_shapley(
+            [0], u, done=MaxUpdates(1), seed=seed
+        )
+    assert np.all(np.isfinite(values.values))
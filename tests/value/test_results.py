@@ -11,7 +11,7 @@ import numpy as np
 import pytest
 
 from pydvl.utils.status import Status
-from pydvl.value.result import ValuationResult
+from pydvl.value.result import ValuationResult, sum_results
 
 
 @pytest.fixture
@@ -158,6 +158,23 @@ def test_updating():
     assert v.counts[1] == 2
 
 
+def test_update_many():
+    indices = np.array([3, 4, 5])
+    v = ValuationResult(values=np.array([3.0, 1.0, 2.0]), indices=indices)
+    w = deepcopy(v)
+
+    new_values = np.array([1.0, 4.0])
+    v.update_many(np.array([5, 3]), new_values)
+    w.update(5, 1.0)
+    w.update(3, 4.0)
+    np.testing.assert_allclose(v.values, w.values)
+    np.testing.assert_allclose(v.variances, w.variances)
+    np.testing.assert_array_equal(v.counts, w.counts)
+
+    with pytest.raises(IndexError):
+        v.update_many(np.array([0]), np.array([1.0]))
+
+
 def test_updating_order_invariance():
     updates = [0.8, 0.9, 1.0, 1.1, 1.2]
     values = []
@@ -423,6 +440,12 @@ def test_names(data_names):
     assert np.all(v.names == np.array(data_names))
 
 
+@pytest.mark.parametrize("data_names", [["a", "b", "a"], [1, 2, 2]])
+def test_duplicate_names(data_names):
+    with pytest.raises(ValueError):
+        ValuationResult(values=np.zeros(len(data_names)), data_names=data_names)
+
+
 @pytest.mark.parametrize("n", [0, 5])
 def test_empty(n):
     v = ValuationResult.empty()
@@ -430,3 +453,48 @@ def test_empty(n):
     v2 = ValuationResult(values=np.arange(n))
     v += v2
     assert len(v2) == n
+
+
+@pytest.mark.parametrize("n_results", [1, 2, 5])
+def test_sum_results(n_results, seed):
+    """The single-pass reducer must agree with adding results pairwise."""
+    rng = np.random.default_rng(seed)
+    results = []
+    for _ in range(n_results):
+        indices = np.sort(rng.choice(20, size=8, replace=False))
+        results.append(
+            ValuationResult(
+                algorithm="test",
+                indices=indices,
+                values=rng.normal(size=8),
+                variances=rng.uniform(size=8),
+                counts=rng.integers(1, 10, size=8),
+                data_names=[f"x{i}" for i in indices],
+            )
+        )
+    results.append(ValuationResult.empty(algorithm="test"))
+
+    expected = functools.reduce(operator.add, results)
+    result = sum_results(results)
+
+    np.testing.assert_array_equal(result.indices, expected.indices)
+    np.testing.assert_array_equal(result.names, expected.names)
+    np.testing.assert_array_equal(result.counts, expected.counts)
+    np.testing.assert_allclose(result.values, expected.values)
+    np.testing.assert_allclose(result.variances, expected.variances, atol=1e-12)
+
+
+def test_sum_results_checks():
+    """Like addition, the reducer must not mix algorithms or names."""
+    a = ValuationResult(
+        algorithm="a", values=np.array([1.0, 2.0]), data_names=["x", "y"]
+    )
+    b = ValuationResult(algorithm="b", values=np.array([1.0, 2.0]))
+    with pytest.raises(ValueError):
+        sum_results([a, b])
+
+    c = ValuationResult(
+        algorithm="a", values=np.array([1.0, 2.0]), data_names=["x", "z"]
+    )
+    with pytest.raises(ValueError):
+        sum_results([a, c])
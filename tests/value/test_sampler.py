@@ -59,6 +59,23 @@ def test_proper_reproducible(sampler_class, indices, seed):
         assert set(subset_1) == set(subset_2)
 
 
+@pytest.mark.parametrize("sampler_class", [UniformSampler, AntitheticSampler])
+def test_random_index_iteration_reproducible(sampler_class, seed):
+    """Test that the random iteration over indices uses the sampler's seed."""
+    indices = np.arange(100)
+
+    def outer_indices():
+        sampler = sampler_class(
+            indices,
+            index_iteration=sampler_class.IndexIteration.Random,
+            seed=seed,
+        )
+        it = sampler.iterindices()
+        return [next(it) for _ in range(20)]
+
+    assert outer_indices() == outer_indices()
+
+
 @pytest.mark.parametrize(
     "sampler_class",
     [